@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+Throughput benchmark for GET /api/recipes/{recipe_id}/cart-options.
+
+Seeds N synthetic recipes into Mongo (or uses --recipe-ids), then drives
+cart-options against a running backend at a fixed concurrency and reports
+throughput and latency percentiles. Run the backend against
+walmart_stub_server.py so no live Walmart credentials are needed:
+
+    export ADMIN_API_KEY=benchmark-admin-key  # /metrics/performance is admin only
+    python walmart_stub_server.py --port 8095 &
+    WALMART_API_BASE_URL=http://localhost:8095 WALMART_CONSUMER_ID=stub \\
+        WALMART_PRIVATE_KEY="$(cat stub_key.pem)" python main.py &
+    python benchmarks/cart_options.py --recipes 50 --requests 500 --concurrency 20 --cold
+
+--cold passes refresh=true so every request re-searches its ingredients instead
+of being served from the per-recipe cart snapshot.
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import statistics
+import time
+import uuid
+from collections import Counter
+from pathlib import Path
+from typing import Dict, List
+
+import httpx
+
+FIXTURES = Path(__file__).resolve().parent / "fixtures" / "walmart_search_items.json"
+EXTRA_INGREDIENTS = [
+    "red bell pepper", "soy sauce", "black beans", "diced tomatoes", "lime", "cilantro",
+    "brown sugar", "butter", "heavy cream", "parmesan cheese", "ginger", "green onions",
+    "chicken broth", "carrots", "celery", "lemon", "paprika", "cumin", "tortillas", "avocado",
+]
+
+
+async def seed_recipes(count: int, ingredients_per_recipe: int) -> List[str]:
+    from motor.motor_asyncio import AsyncIOMotorClient
+
+    pool = list(json.loads(FIXTURES.read_text())) + EXTRA_INGREDIENTS
+    client = AsyncIOMotorClient(os.environ.get("MONGO_URL", "mongodb://localhost:27017"))
+    collection = client[os.environ["DB_NAME"]]["recipes"]
+    docs = []
+    for index in range(count):
+        ingredients = random.sample(pool, k=min(ingredients_per_recipe, len(pool)))
+        docs.append({
+            "id": str(uuid.uuid4()),
+            "name": f"Benchmark Recipe {index + 1}",
+            "ingredients": ingredients,
+            "ingredients_clean": ingredients,
+            "benchmark": True,
+        })
+    await collection.insert_many(docs)
+    client.close()
+    return [doc["id"] for doc in docs]
+
+
+async def remove_seeded_recipes() -> int:
+    from motor.motor_asyncio import AsyncIOMotorClient
+
+    client = AsyncIOMotorClient(os.environ.get("MONGO_URL", "mongodb://localhost:27017"))
+    db = client[os.environ["DB_NAME"]]
+    seeded = await db["recipes"].find({"benchmark": True}, {"_id": 1}).to_list(length=None)
+    await db["grocery_carts"].delete_many({"recipe_id": {"$in": [str(doc["_id"]) for doc in seeded]}})
+    result = await db["recipes"].delete_many({"benchmark": True})
+    client.close()
+    return result.deleted_count
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    return sorted_values[min(len(sorted_values) - 1, int(len(sorted_values) * pct))]
+
+
+async def drive(base_url: str, recipe_ids: List[str], total_requests: int, concurrency: int, cold: bool, timeout: float) -> Dict:
+    latencies: List[float] = []
+    statuses: Counter = Counter()
+    api_statuses: Counter = Counter()
+    queue: asyncio.Queue = asyncio.Queue()
+    for index in range(total_requests):
+        queue.put_nowait(recipe_ids[index % len(recipe_ids)])
+
+    async def worker(client: httpx.AsyncClient):
+        while True:
+            try:
+                recipe_id = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            started = time.perf_counter()
+            try:
+                response = await client.get(
+                    f"{base_url}/recipes/{recipe_id}/cart-options",
+                    params={"refresh": "true"} if cold else None,
+                )
+                statuses[response.status_code] += 1
+                api_statuses[response.json().get("walmart_api_status", "unknown")] += 1
+            except httpx.HTTPError as error:
+                statuses[type(error).__name__] += 1
+            latencies.append((time.perf_counter() - started) * 1000)
+
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(timeout=timeout, limits=limits) as client:
+        started = time.perf_counter()
+        await asyncio.gather(*(worker(client) for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "requests": len(latencies),
+        "concurrency": concurrency,
+        "elapsed_seconds": round(elapsed, 2),
+        "throughput_rps": round(len(latencies) / elapsed, 2) if elapsed else 0.0,
+        "p50_ms": round(percentile(latencies, 0.50), 1),
+        "p95_ms": round(percentile(latencies, 0.95), 1),
+        "p99_ms": round(percentile(latencies, 0.99), 1),
+        "mean_ms": round(statistics.fmean(latencies), 1),
+        "http_statuses": dict(statuses),
+        "walmart_api_statuses": dict(api_statuses),
+    }
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="cart-options throughput benchmark")
+    parser.add_argument("--base-url", default="http://localhost:8080/api")
+    parser.add_argument("--recipes", type=int, default=20, help="Synthetic recipes to seed")
+    parser.add_argument("--ingredients", type=int, default=10, help="Ingredients per seeded recipe")
+    parser.add_argument("--recipe-ids", help="File with one existing recipe id per line instead of seeding")
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--cold", action="store_true", help="Bypass cart snapshots with refresh=true")
+    parser.add_argument("--timeout", type=float, default=120.0)
+    parser.add_argument("--keep", action="store_true", help="Leave seeded recipes in Mongo")
+    parser.add_argument("--admin-key", default=os.environ.get("ADMIN_API_KEY", ""), help="X-Admin-Key for /metrics/performance")
+    args = parser.parse_args()
+
+    if args.recipe_ids:
+        recipe_ids = [line.strip() for line in Path(args.recipe_ids).read_text().splitlines() if line.strip()]
+    else:
+        recipe_ids = await seed_recipes(args.recipes, args.ingredients)
+        print(f"Seeded {len(recipe_ids)} recipes with {args.ingredients} ingredients each")
+
+    admin_headers = {"X-Admin-Key": args.admin_key}
+    try:
+        async with httpx.AsyncClient(timeout=10.0, headers=admin_headers) as client:
+            metrics_before = (await client.get(f"{args.base_url}/metrics/performance")).json()
+        report = await drive(args.base_url, recipe_ids, args.requests, args.concurrency, args.cold, args.timeout)
+        async with httpx.AsyncClient(timeout=10.0, headers=admin_headers) as client:
+            metrics_after = (await client.get(f"{args.base_url}/metrics/performance")).json()
+    finally:
+        if not args.recipe_ids and not args.keep:
+            print(f"Removed {await remove_seeded_recipes()} seeded recipes")
+
+    print(json.dumps(report, indent=2))
+    for section in ("walmart_search_cache", "walmart_rate_limit", "walmart_http"):
+        print(f"{section}: before={json.dumps(metrics_before.get(section))}")
+        print(f"{section}: after={json.dumps(metrics_after.get(section))}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
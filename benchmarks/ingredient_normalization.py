@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Benchmark for ingredient normalization on a corpus of real recipe ingredient lines.
+
+Compares the original per-call regex implementation of clean_ingredient_for_search
+(kept below as the reference) with the precompiled IngredientNormalizer: cold
+per-line calls, memoized calls, and the batch API. Also reports any lines whose
+search term differs from the reference, and any corpus line whose parse differs
+from EXPECTED_PARSES (lines the reference gets wrong too).
+
+Usage:
+    python benchmarks/ingredient_normalization.py --rounds 200
+"""
+import argparse
+import os
+import re
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+os.environ.setdefault("DB_NAME", "benchmark")
+
+import logging
+
+logging.disable(logging.CRITICAL)
+
+from backend import server  # noqa: E402
+
+CORPUS = Path(__file__).resolve().parent / "fixtures" / "ingredient_lines.txt"
+
+# Corpus lines with a known-correct (quantity, unit, search_term)
+EXPECTED_PARSES = {
+    "1 ½ cups cooked quinoa": (1.5, "cup", "quinoa"),
+    "1½ cups milk": (1.5, "cup", "milk"),
+    "2 lbs boneless, skinless chicken breasts, cut into 1-inch pieces": (2.0, "lb", "chicken breast"),
+    "2-3 cloves garlic, crushed": (3.0, "clove", "garlic"),
+    "1 can (13.5 oz) coconut milk": (1.0, "can", "coconut milk"),
+}
+
+
+def reference_clean_ingredient_for_search(ingredient: str) -> str:
+    """The implementation IngredientNormalizer replaced, kept verbatim for comparison."""
+    cleaned = ingredient.split(',')[0].strip()
+    cleaned = re.sub(r'^\d+(?:\.\d+)?\s*(?:cups?|tablespoons?|tbsp|teaspoons?|tsp|pounds?|lbs?|lb|ounces?|oz|grams?|g|ml|l|pints?|quarts?|gallons?)\s+', '', cleaned, flags=re.IGNORECASE)
+    descriptor_words = [
+        'fresh', 'dried', 'ground', 'boneless', 'skinless', 'seedless', 'seeded',
+        'chopped', 'diced', 'minced', 'sliced', 'crushed', 'whole', 'raw', 'cooked',
+        'ripe', 'unripe', 'canned', 'frozen', 'thawed', 'raw', 'roasted'
+    ]
+    for desc in descriptor_words:
+        cleaned = re.sub(r'\b' + desc + r'\b', '', cleaned, flags=re.IGNORECASE)
+    cleaned = re.sub(r'\b(and|or|with|of)\b', '', cleaned, flags=re.IGNORECASE)
+    cleaned = re.sub(r'\s+', ' ', cleaned).strip()
+    cleaned_lower = cleaned.lower()
+    for key, value in server.INGREDIENT_SEARCH_MAPPINGS.items():
+        if key.lower() in cleaned_lower:
+            return value
+    if len(cleaned) < 2:
+        for word in ingredient.split():
+            if len(word) > 2 and word.lower() not in ['the', 'and', 'or', 'with', 'of', 'cups', 'tbsp', 'tsp', 'lbs', 'oz', 'cup', 'tbsp']:
+                return word
+        return ingredient
+    return cleaned
+
+
+def timed(label: str, fn, lines_processed: int) -> float:
+    started = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - started
+    per_line_us = elapsed / lines_processed * 1_000_000
+    print(f"{label:<28} {per_line_us:>8.2f}µs/line   {lines_processed / elapsed:>12,.0f} lines/s")
+    return per_line_us
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Ingredient normalization benchmark")
+    parser.add_argument("--rounds", type=int, default=200)
+    args = parser.parse_args()
+
+    lines = [line.strip() for line in CORPUS.read_text().splitlines() if line.strip()]
+    total = len(lines) * args.rounds
+    normalizer = server.ingredient_normalizer
+    print(f"{len(lines)} ingredient lines x {args.rounds} rounds")
+
+    def reference():
+        for _ in range(args.rounds):
+            for line in lines:
+                reference_clean_ingredient_for_search(line)
+
+    def cold():
+        for _ in range(args.rounds):
+            normalizer.clean.cache_clear()
+            for line in lines:
+                normalizer.clean(line)
+
+    def memoized():
+        for _ in range(args.rounds):
+            for line in lines:
+                normalizer.clean(line)
+
+    def batch():
+        for _ in range(args.rounds):
+            normalizer.clean_many(lines)
+
+    def parse_batch():
+        for _ in range(args.rounds):
+            normalizer.parse_many(lines)
+
+    before = timed("reference (before)", reference, total)
+    after_cold = timed("precompiled, uncached", cold, total)
+    after_memo = timed("precompiled, memoized", memoized, total)
+    timed("batch clean_many", batch, total)
+    timed("batch parse_many", parse_batch, total)
+    print(f"\nuncached: {before / after_cold:.1f}x faster, memoized: {before / after_memo:.0f}x faster")
+
+    mismatches = [(line, reference_clean_ingredient_for_search(line), normalizer.clean(line)) for line in lines]
+    mismatches = [row for row in mismatches if row[1] != row[2]]
+    print(f"search-term mismatches vs reference: {len(mismatches)}")
+    for line, expected, actual in mismatches:
+        print(f"  {line!r}: {expected!r} -> {actual!r}")
+
+    wrong = []
+    for line, expected in EXPECTED_PARSES.items():
+        parsed = normalizer.parse(line)
+        if (parsed.quantity, parsed.unit, parsed.search_term) != expected:
+            wrong.append((line, expected, parsed))
+    print(f"parses differing from EXPECTED_PARSES: {len(wrong)}")
+    for line, expected, parsed in wrong:
+        print(f"  {line!r}: expected {expected} -> {(parsed.quantity, parsed.unit, parsed.search_term)}")
+
+    print("\nsample parses:")
+    for line in lines[:3] + lines[-6:-2]:
+        print(f"  {normalizer.parse(line)}")
+
+
+if __name__ == "__main__":
+    main()
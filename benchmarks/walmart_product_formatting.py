@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+Benchmark for Walmart product formatting on recorded search payloads.
+
+Formats every item in benchmarks/fixtures/walmart_search_items.json with the
+original format_walmart_product (kept below as the reference, logging at INFO
+into an in-memory stream the way production logs to stdout) and with the
+WalmartProduct-based formatter, then checks both produce the same fields apart
+from the ratings the reference used to make up.
+
+Usage:
+    python benchmarks/walmart_product_formatting.py --rounds 500
+"""
+import argparse
+import io
+import json
+import logging
+import os
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+os.environ.setdefault("DB_NAME", "benchmark")
+
+# Keep the backend's startup logging quiet; the reference logger below stays at INFO
+logging.getLogger("backend.server").setLevel(logging.WARNING)
+
+from backend import server  # noqa: E402
+
+FIXTURES = Path(__file__).resolve().parent / "fixtures" / "walmart_search_items.json"
+
+logger = logging.getLogger("walmart_format_reference")
+logger.propagate = False
+logger.setLevel(logging.INFO)
+logger.addHandler(logging.StreamHandler(io.StringIO()))
+
+
+def reference_format_walmart_product(product: dict, ingredient: str, rank: int) -> dict:
+    """Format Walmart API product response for our frontend"""
+    try:
+        logger.info(f"📦 [FORMAT] Formatting product #{rank + 1} for ingredient '{ingredient}'")
+        # Extract product data
+        raw_item_id = product.get('itemId')
+        raw_us_item_id = product.get('usItemId')
+        item_id_source = 'itemId'
+        item_id = str(raw_item_id or '').strip()
+
+        if not item_id:
+            item_id = str(raw_us_item_id or '').strip()
+            item_id_source = 'usItemId'
+
+        name = product.get('name', 'Unknown Product')
+        price = float(product.get('salePrice', product.get('msrp', 0)))
+        msrp = float(product.get('msrp', price))
+        
+        logger.info(f"📦 [FORMAT] Product name: '{name[:60]}...'" if len(name) > 60 else f"📦 [FORMAT] Product name: '{name}'")
+        logger.info(f"📦 [FORMAT] Price: ${price}, MSRP: ${msrp}")
+        logger.info(f"📦 [FORMAT] Walmart cart item ID source: {item_id_source}, value: {item_id or '[missing]'}")
+        
+        # Calculate savings
+        savings = max(0, msrp - price)
+        is_best_price = rank == 0  # First result is best price
+        
+        # Get additional details
+        brand = product.get('brandName', 'Generic')
+        image_url = product.get('thumbnailImage', product.get('mediumImage', ''))
+        
+        logger.info(f"📦 [FORMAT] Brand: {brand}, Has image: {bool(image_url)}")
+        
+        # Determine size from name or use default
+        size = reference_extract_size_from_name(name)
+        
+        # Calculate rating from customer review
+        customer_rating = product.get('customerRating', 0)
+        if customer_rating:
+            rating = round(float(customer_rating), 1)
+        else:
+            rating = round(4.0 + random.uniform(0, 0.8), 1)  # Fallback rating
+        
+        # Review count
+        review_count = product.get('numReviews', random.randint(50, 500))
+        
+        # Availability
+        availability = "InStock" if product.get('availableOnline', True) else "OutOfStock"
+        
+        formatted_product = {
+            "itemId": item_id,
+            "cartItemId": item_id,
+            "cart_item_id_source": item_id_source,
+            "walmart_api_item_id": str(raw_item_id or '').strip(),
+            "walmart_api_us_item_id": str(raw_us_item_id or '').strip(),
+            "name": name,
+            "price": round(price, 2),
+            "brand": brand,
+            "size": size,
+            "image": image_url,
+            "ingredient_match": ingredient,
+            "availability": availability,
+            "rating": rating,
+            "reviewCount": int(review_count),
+            "search_rank": rank + 1,
+            "is_best_price": is_best_price,
+            "msrp": round(msrp, 2),
+            "savings_amount": round(savings, 2),
+            "clearance": product.get('clearance', False),
+            "rollback": savings > 0.50,  # Consider rollback if saving more than 50 cents
+            "category": reference_categorize_product(name),
+            "nutrition_facts": False,  # Walmart API doesn't provide this easily
+            "organic": 'organic' in name.lower(),
+            "store_brand": brand.lower() in ['great value', 'marketside', 'equate'],
+            "walmart_url": server.normalize_walmart_product_url(product.get('productUrl', ''), item_id),
+            "upc": product.get('upc', ''),
+            "model_number": product.get('modelNumber', ''),
+            "marketplace": product.get('marketplace', False)
+        }
+        
+        logger.info(f"✅ [FORMAT] Successfully formatted product: {formatted_product['name'][:50]}... (${formatted_product['price']})")
+        return formatted_product
+        
+    except Exception as e:
+        logger.error(f"❌ [FORMAT] Error formatting Walmart product for ingredient '{ingredient}': {e}")
+        import traceback
+        logger.error(f"❌ [FORMAT] Stack trace: {traceback.format_exc()}")
+        return None
+
+def reference_extract_size_from_name(name: str) -> str:
+    """Extract size information from product name"""
+    import re
+    
+    # Common size patterns
+    size_patterns = [
+        r'(\d+(?:\.\d+)?\s*(?:oz|lb|lbs|pounds?|ounces?|fl\s*oz|gallon|qt|quart))',
+        r'(\d+(?:\.\d+)?\s*(?:g|kg|grams?|kilograms?))',
+        r'(\d+\s*(?:pack|ct|count|piece))',
+        r'(\d+(?:\.\d+)?\s*(?:L|ml|liter|milliliter))'
+    ]
+    
+    for pattern in size_patterns:
+        match = re.search(pattern, name, re.IGNORECASE)
+        if match:
+            return match.group(1).strip()
+    
+    return "Standard Size"
+
+def reference_categorize_product(name: str) -> str:
+    """Categorize product based on name"""
+    name_lower = name.lower()
+    
+    if any(meat in name_lower for meat in ['chicken', 'beef', 'pork', 'fish', 'turkey', 'lamb', 'seafood']):
+        return 'meat'
+    elif any(produce in name_lower for produce in ['fresh', 'organic', 'vegetable', 'fruit', 'lettuce', 'tomato', 'onion', 'potato']):
+        return 'produce'
+    elif any(dairy in name_lower for dairy in ['milk', 'cheese', 'yogurt', 'butter', 'cream', 'eggs']):
+        return 'dairy'
+    elif any(pantry in name_lower for pantry in ['sauce', 'oil', 'vinegar', 'flour', 'sugar', 'spice', 'canned', 'pasta']):
+        return 'pantry'
+    else:
+        return 'grocery'
+
+
+def timed(label: str, fn, products_formatted: int) -> float:
+    started = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - started
+    per_product_us = elapsed / products_formatted * 1_000_000
+    print(f"{label:<30} {per_product_us:>8.2f}µs/product   {products_formatted / elapsed:>10,.0f} products/s")
+    return per_product_us
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Walmart product formatting benchmark")
+    parser.add_argument("--rounds", type=int, default=500)
+    args = parser.parse_args()
+
+    payloads = [(item, query, rank) for query, items in json.loads(FIXTURES.read_text()).items() for rank, item in enumerate(items)]
+    # Payloads without ratings exercise the reference's random fallback
+    payloads += [({key: value for key, value in item.items() if key not in {"customerRating", "numReviews"}}, query, rank) for item, query, rank in payloads[:5]]
+    total = len(payloads) * args.rounds
+    print(f"{len(payloads)} recorded products x {args.rounds} rounds")
+
+    def reference():
+        for _ in range(args.rounds):
+            for item, query, rank in payloads:
+                reference_format_walmart_product(item, query, rank)
+
+    def lean():
+        for _ in range(args.rounds):
+            for item, query, rank in payloads:
+                server.format_walmart_product(item, query, rank)
+
+    before = timed("reference (before)", reference, total)
+    after = timed("WalmartProduct (after)", lean, total)
+    print(f"\n{before / after:.1f}x faster")
+
+    differences = 0
+    for item, query, rank in payloads:
+        expected = reference_format_walmart_product(item, query, rank)
+        actual = server.format_walmart_product(item, query, rank)
+        made_up = set() if "customerRating" in item else {"rating", "reviewCount"}
+        differing = sorted(key for key in (set(expected) | set(actual)) - made_up if expected.get(key) != actual.get(key))
+        if differing:
+            differences += 1
+            print(f"  {item.get('name')!r}: {differing}")
+    print(f"products with differing fields (ignoring made-up ratings): {differences}")
+
+
+if __name__ == "__main__":
+    main()
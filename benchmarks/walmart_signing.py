@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Microbenchmark for Walmart request signing.
+
+Compares the per-request cost of:
+  - reloading the RSA key and signing on every call (the old behaviour)
+  - signing with the cached key
+  - reusing a signed header set within WALMART_SIGNATURE_REUSE_SECONDS
+
+Usage:
+    python benchmarks/walmart_signing.py --iterations 500
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+os.environ.setdefault("DB_NAME", "benchmark")
+os.environ.setdefault("MONGO_URL", "mongodb://localhost:27017")
+
+import logging
+
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+
+logging.disable(logging.CRITICAL)
+
+from backend import server  # noqa: E402
+
+
+def make_env_style_key() -> str:
+    """A fresh 2048-bit PKCS#8 key flattened onto one line, the way it arrives from env vars"""
+    key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    pem = key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption(),
+    ).decode("utf-8")
+    return pem.strip().replace("\n", " ")
+
+
+def measure(label: str, fn, iterations: int) -> float:
+    samples = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - started) * 1_000_000)
+    samples.sort()
+    p50 = statistics.median(samples)
+    p99 = samples[min(len(samples) - 1, int(len(samples) * 0.99))]
+    print(f"{label:<34} p50 {p50:>10.1f}µs   p99 {p99:>10.1f}µs")
+    return p50
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--iterations", type=int, default=300)
+    args = parser.parse_args()
+
+    consumer_id = "benchmark-consumer-id"
+    private_key = make_env_style_key()
+    timestamp = str(int(time.time() * 1000))
+
+    def reload_and_sign():
+        server._walmart_signing_key["fingerprint"] = None
+        server.generate_walmart_signature(consumer_id, private_key, timestamp)
+
+    def cached_key_sign():
+        server.generate_walmart_signature(consumer_id, private_key, timestamp)
+
+    def reused_headers():
+        server.build_walmart_auth_headers(consumer_id, private_key)
+
+    print(f"Walmart signing, {args.iterations} iterations")
+    before = measure("reload key + sign (before)", reload_and_sign, args.iterations)
+    cached = measure("cached key + sign", cached_key_sign, args.iterations)
+    reused = measure("reused signed headers", reused_headers, args.iterations)
+    print(f"\ncached key: {before / cached:.1f}x faster, header reuse: {before / reused:.0f}x faster than before")
+
+
+if __name__ == "__main__":
+    main()
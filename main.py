@@ -8,6 +8,7 @@ import sys
 import signal
 import uvicorn
 import logging
+from contextlib import asynccontextmanager
 from pathlib import Path
 from datetime import datetime
 from fastapi import FastAPI, Request, HTTPException
@@ -37,8 +38,18 @@ logger.info(f"  OPENAI_API_KEY: {'✅ Set' if os.environ.get('OPENAI_API_KEY') e
 logger.info(f"  MONGO_URL: {'✅ Set' if os.environ.get('MONGO_URL') else '❌ Missing'}")
 logger.info(f"  DB_NAME: {'✅ Set' if os.environ.get('DB_NAME') else '❌ Missing'}")
 
+@asynccontextmanager
+async def lifespan(_app: FastAPI):
+    """Run the backend's startup/shutdown hooks; Starlette skips them for mounted sub-apps"""
+    if backend_app is not None and backend_available:
+        async with backend_app.router.lifespan_context(backend_app):
+            yield
+    else:
+        yield
+
 # Create main FastAPI app first (always succeeds)
 app = FastAPI(
+    lifespan=lifespan,
     title="buildyoursmartcart.com",
     description="AI Recipe + Grocery Delivery App - Weekly Meal Planning & Walmart Integration",
     version="2.2.0",
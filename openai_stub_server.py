@@ -0,0 +1,465 @@
+#!/usr/bin/env python3
+"""
+Local OpenAI-compatible stand-in for load testing the generation endpoints.
+
+Serves POST /v1/chat/completions (streaming and non-streaming) so the backend's
+full handler path - prompt building, parsing, validation, Mongo writes - can be
+exercised offline. Completions are either replayed from a recording or
+synthesized as schema-valid JSON for the recipe, weekly plan (single, skeleton,
+per-day) and Starbucks prompts. Latency and errors are injected on request.
+
+Usage:
+    # Synthesize everything, ~1.5s median latency, 2% 500s and 1% 429s
+    python openai_stub_server.py --port 8090 --latency lognormal:1.5,0.5 --error-rate 500=0.02,429=0.01
+
+    # Record real completions through the stub, then replay them
+    python openai_stub_server.py --record-upstream https://api.openai.com/v1 --recordings recordings.jsonl
+    python openai_stub_server.py --recordings recordings.jsonl
+
+    # Point the backend at it
+    OPENAI_BASE_URL=http://localhost:8090/v1 OPENAI_API_KEY=stub python main.py
+"""
+import argparse
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import random
+import re
+import sys
+import time
+import uuid
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import httpx
+import uvicorn
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, StreamingResponse
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    handlers=[logging.StreamHandler(sys.stdout)]
+)
+logger = logging.getLogger("openai_stub")
+
+WEEK_DAYS = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
+STUB_INGREDIENTS = [
+    ("1 lb chicken breast, diced", "chicken breast"),
+    ("2 cups jasmine rice", "jasmine rice"),
+    ("1 red bell pepper, sliced", "red bell pepper"),
+    ("3 cloves garlic, minced", "garlic"),
+    ("1 yellow onion, chopped", "yellow onion"),
+    ("2 tbsp olive oil", "olive oil"),
+    ("1 can diced tomatoes", "diced tomatoes"),
+    ("8 oz penne pasta", "penne pasta"),
+    ("1 cup shredded cheddar cheese", "cheddar cheese"),
+    ("2 cups fresh spinach", "spinach"),
+    ("1 lb ground beef", "ground beef"),
+    ("4 large eggs", "eggs"),
+    ("1 cup black beans, rinsed", "black beans"),
+    ("2 tbsp soy sauce", "soy sauce"),
+    ("1 lime, juiced", "lime"),
+]
+STUB_DISHES = ["Skillet", "Bowl", "Stir-Fry", "Bake", "Tacos", "Pasta", "Salad", "Soup", "Wraps", "Curry"]
+
+
+# ============================================================================
+# LATENCY AND ERROR INJECTION
+# ============================================================================
+
+class LatencyModel:
+    """Samples a delay in seconds from ``fixed:S``, ``uniform:LO,HI`` or ``lognormal:MEDIAN,SIGMA``."""
+
+    def __init__(self, spec: str):
+        kind, _, args = spec.partition(":")
+        self.kind = kind
+        self.args = [float(value) for value in args.split(",") if value] if args else []
+        if kind not in {"fixed", "uniform", "lognormal"}:
+            raise ValueError(f"Unknown latency model: {spec}")
+
+    def sample(self) -> float:
+        if self.kind == "fixed":
+            return self.args[0] if self.args else 0.0
+        if self.kind == "uniform":
+            return random.uniform(self.args[0], self.args[1])
+        median, sigma = self.args
+        return random.lognormvariate(0.0, sigma) * median
+
+
+def parse_error_rates(spec: str) -> List[Tuple[int, float]]:
+    """``500=0.02,429=0.01,timeout=0.005`` -> [(500, 0.02), (429, 0.01), (0, 0.005)]; 0 means hang."""
+    rates = []
+    for entry in filter(None, (part.strip() for part in spec.split(","))):
+        code, _, rate = entry.partition("=")
+        rates.append((0 if code == "timeout" else int(code), float(rate)))
+    return rates
+
+
+# ============================================================================
+# PROMPT DETECTION AND SYNTHESIS
+# ============================================================================
+
+def detect_template(messages: List[Dict[str, Any]]) -> str:
+    system_text = " ".join(message.get("content", "") for message in messages if message.get("role") == "system")
+    if "Starbucks" in system_text:
+        return "starbucks_drink"
+    if "Outline 7-day meal plans" in system_text:
+        return "weekly_skeleton"
+    if "one day of a weekly meal plan" in system_text:
+        return "weekly_day"
+    if "7-day meal plans" in system_text:
+        return "weekly_plan"
+    return "recipe"
+
+
+def _user_text(messages: List[Dict[str, Any]]) -> str:
+    return "\n".join(message.get("content", "") for message in messages if message.get("role") == "user")
+
+
+def _match(pattern: str, text: str, default: str) -> str:
+    found = re.search(pattern, text)
+    return found.group(1).strip() if found else default
+
+
+def _stub_meal(day: str, meal_type: str, cuisine: str, servings: int, name: Optional[str] = None) -> Dict[str, Any]:
+    picked = random.sample(STUB_INGREDIENTS, k=random.randint(5, 8))
+    prep, cook = random.choice([10, 15, 20]), random.choice([15, 20, 30, 40])
+    return {
+        "day": day,
+        "name": name or f"{cuisine.title()} {random.choice(STUB_DISHES)}",
+        "description": f"A simple {cuisine} {meal_type} generated by the local stub.",
+        "cuisine_type": cuisine,
+        "meal_type": meal_type,
+        "difficulty": "easy",
+        "prep_time": f"{prep} minutes",
+        "cook_time": f"{cook} minutes",
+        "total_time": f"{prep + cook} minutes",
+        "servings": servings,
+        "ingredients": [raw for raw, _ in picked],
+        "ingredients_clean": [clean for _, clean in picked],
+        "instructions": [f"Step {index + 1}: prepare and cook." for index in range(random.randint(4, 7))],
+        "nutrition": {"calories": f"{random.randint(300, 700)} per serving", "protein": "25g", "carbs": "40g", "fat": "15g"},
+        "cooking_tips": ["Prep everything before you start.", "Season to taste."],
+        "estimated_cost": round(random.uniform(6, 18), 2),
+    }
+
+
+def synthesize_recipe(messages: List[Dict[str, Any]]) -> Dict[str, Any]:
+    text = _user_text(messages)
+    cuisine = _match(r"Create a detailed (.+?) \S+ recipe", text, "american")
+    meal_type = _match(r"Create a detailed .+? (\S+) recipe", text, "dinner")
+    servings = int(_match(r"Servings: (\d+)", text, "4"))
+    recipe = _stub_meal("", meal_type, cuisine, servings)
+    recipe.pop("day")
+    recipe["difficulty"] = _match(r"Difficulty: (\S+)", text, "easy")
+    return recipe
+
+
+def _weekly_request(messages: List[Dict[str, Any]]) -> Tuple[int, List[str], List[str]]:
+    text = _user_text(messages)
+    family_size = int(_match(r"exactly (\d+) people", text, "4"))
+    meal_types = [value.strip() for value in _match(r"Meal types: (.+)", text, "dinner").split(",") if value.strip()]
+    cuisines_text = _match(r"Preferred cuisines: (.+)", text, "varied cuisines")
+    cuisines = ["american", "italian", "mexican", "asian"] if cuisines_text == "varied cuisines" else [c.strip() for c in cuisines_text.split(",")]
+    return family_size, meal_types, cuisines
+
+
+def synthesize_weekly_plan(messages: List[Dict[str, Any]]) -> Dict[str, Any]:
+    family_size, meal_types, cuisines = _weekly_request(messages)
+    meals = [_stub_meal(day, meal_type, random.choice(cuisines), family_size) for day in WEEK_DAYS for meal_type in meal_types]
+    return {
+        "week_of": time.strftime("%Y-%m-%d"),
+        "family_size": family_size,
+        "total_estimated_cost": round(sum(meal["estimated_cost"] for meal in meals), 2),
+        "ai_generated": True,
+        "meals": meals,
+        "shopping_list": sorted({clean for meal in meals for clean in meal["ingredients_clean"]}),
+    }
+
+
+def synthesize_weekly_skeleton(messages: List[Dict[str, Any]]) -> Dict[str, Any]:
+    _, meal_types, cuisines = _weekly_request(messages)
+    return {
+        "days": [
+            {
+                "day": day,
+                "meals": [
+                    {"meal_type": meal_type, "name": f"{day} {meal_type.title()} {random.choice(STUB_DISHES)}", "cuisine_type": random.choice(cuisines)}
+                    for meal_type in meal_types
+                ],
+            }
+            for day in WEEK_DAYS
+        ]
+    }
+
+
+def synthesize_weekly_day(messages: List[Dict[str, Any]]) -> Dict[str, Any]:
+    text = _user_text(messages)
+    day = _match(r"Write the full recipes for (\w+)", text, "Monday")
+    family_size = int(_match(r"exactly (\d+) people", text, "4"))
+    slots = re.findall(r"^- (\w+): (.+?) \((.+?)\)$", text, re.MULTILINE)
+    slots = [slot for slot in slots if slot[0] not in {"Dietary", "Cooking", "Budget", "Dishes"}] or [("dinner", "your choice", "any cuisine")]
+    return {
+        "meals": [
+            _stub_meal(day, meal_type, "american" if cuisine == "any cuisine" else cuisine, family_size, None if name == "your choice" else name)
+            for meal_type, name, cuisine in slots
+        ]
+    }
+
+
+def synthesize_starbucks_drink(messages: List[Dict[str, Any]], invalid_rate: float) -> Dict[str, Any]:
+    system_text = " ".join(message.get("content", "") for message in messages if message.get("role") == "system")
+    text = _user_text(messages)
+    bases = [value.strip() for value in _match(r"Allowed base drinks for this request: (.+?)\.\n", system_text, "iced matcha latte").split(",")]
+    components = [value.strip() for value in _match(r"Allowed Starbucks ingredients and customizations: (.+?)\.\n", system_text, "vanilla syrup").split(",")]
+    drink_type = _match(r"secret menu (\S+)", text, "random").rstrip(".")
+
+    picked = random.sample(components, k=min(4, len(components)))
+    ingredients, modifications = picked[:3], picked[3:]
+    if random.random() < invalid_rate:
+        # Misspell one component so the backend's repair/retry path gets exercised
+        ingredients[0] = ingredients[0].replace("a", "e", 1) + "s"
+    return {
+        "drink_name": f"Stub {drink_type.replace('_', ' ').title()} Dream",
+        "description": "A drink generated by the local stub.",
+        "category": drink_type,
+        "base_drink": random.choice(bases),
+        "ingredients": ingredients,
+        "modifications": modifications,
+        "flavor_profile": "Sweet and creamy",
+        "color": "Pastel pink",
+        "estimated_price": round(random.uniform(4.5, 7.5), 2),
+        "difficulty_level": "easy",
+        "best_season": "all year",
+        "ai_generated": True,
+    }
+
+
+# ============================================================================
+# STUB SERVER
+# ============================================================================
+
+class StubState:
+    def __init__(self, args: argparse.Namespace):
+        self.latency = LatencyModel(args.latency)
+        self.token_delay = args.token_delay
+        self.error_rates = parse_error_rates(args.error_rate)
+        self.hang_seconds = args.hang_seconds
+        self.starbucks_invalid_rate = args.starbucks_invalid_rate
+        self.strict_replay = args.strict_replay
+        self.record_upstream = args.record_upstream.rstrip("/") if args.record_upstream else None
+        self.recordings_path = Path(args.recordings) if args.recordings else None
+        self.recordings: Dict[str, Dict[str, Any]] = {}
+        self.recordings_by_template: Dict[str, List[Dict[str, Any]]] = {}
+        self.seen_prefixes: set = set()
+        self.stats: Dict[str, int] = {"requests": 0, "streams": 0, "replayed": 0, "synthesized": 0, "recorded": 0, "injected_errors": 0}
+        self._load_recordings()
+
+    def _load_recordings(self) -> None:
+        if not self.recordings_path or not self.recordings_path.exists():
+            return
+        with self.recordings_path.open() as handle:
+            for line in handle:
+                if line.strip():
+                    self._index_recording(json.loads(line))
+        logger.info(f"📼 Loaded {len(self.recordings)} recorded completions from {self.recordings_path}")
+
+    def _index_recording(self, recording: Dict[str, Any]) -> None:
+        self.recordings[recording["key"]] = recording
+        self.recordings_by_template.setdefault(recording["template"], []).append(recording)
+
+    def save_recording(self, recording: Dict[str, Any]) -> None:
+        self._index_recording(recording)
+        self.stats["recorded"] += 1
+        if self.recordings_path:
+            with self.recordings_path.open("a") as handle:
+                handle.write(json.dumps(recording) + "\n")
+
+    def injected_error(self) -> Optional[int]:
+        roll = random.random()
+        for status_code, rate in self.error_rates:
+            if roll < rate:
+                return status_code
+            roll -= rate
+        return None
+
+
+def request_key(model: str, messages: List[Dict[str, Any]]) -> str:
+    return hashlib.sha256(json.dumps({"model": model, "messages": messages}, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def estimate_tokens(text: str) -> int:
+    return max(1, len(text) // 4)
+
+
+def build_usage(state: StubState, messages: List[Dict[str, Any]], content: str) -> Dict[str, Any]:
+    """Rough token counts; a repeated system prefix of 1024+ tokens is reported as cached, like OpenAI does."""
+    prompt_tokens = sum(estimate_tokens(message.get("content", "")) for message in messages)
+    system_text = messages[0].get("content", "") if messages and messages[0].get("role") == "system" else ""
+    prefix_tokens = estimate_tokens(system_text) if system_text else 0
+    prefix_hash = hashlib.sha256(system_text.encode("utf-8")).hexdigest()
+    cached_tokens = (prefix_tokens // 128) * 128 if prefix_hash in state.seen_prefixes and prefix_tokens >= 1024 else 0
+    state.seen_prefixes.add(prefix_hash)
+    completion_tokens = estimate_tokens(content)
+    return {
+        "prompt_tokens": prompt_tokens,
+        "completion_tokens": completion_tokens,
+        "total_tokens": prompt_tokens + completion_tokens,
+        "prompt_tokens_details": {"cached_tokens": cached_tokens},
+    }
+
+
+def create_app(state: StubState) -> FastAPI:
+    app = FastAPI(title="OpenAI stub")
+    upstream_client = httpx.AsyncClient(timeout=300.0) if state.record_upstream else None
+
+    async def completion_content(body: Dict[str, Any], authorization: Optional[str]) -> Optional[str]:
+        model = body.get("model", "stub")
+        messages = body.get("messages", [])
+        template = detect_template(messages)
+        key = request_key(model, messages)
+
+        if state.record_upstream:
+            upstream_body = {k: v for k, v in body.items() if k not in {"stream", "stream_options"}}
+            response = await upstream_client.post(
+                f"{state.record_upstream}/chat/completions",
+                json=upstream_body,
+                headers={"Authorization": authorization or f"Bearer {os.environ.get('OPENAI_API_KEY', '')}"},
+            )
+            response.raise_for_status()
+            content = response.json()["choices"][0]["message"]["content"]
+            state.save_recording({"key": key, "template": template, "model": model, "content": content})
+            return content
+
+        recording = state.recordings.get(key)
+        if not recording and state.recordings_by_template.get(template):
+            recording = random.choice(state.recordings_by_template[template])
+        if recording:
+            state.stats["replayed"] += 1
+            return recording["content"]
+        if state.strict_replay:
+            return None
+
+        state.stats["synthesized"] += 1
+        if template == "starbucks_drink":
+            payload = synthesize_starbucks_drink(messages, state.starbucks_invalid_rate)
+        elif template == "weekly_skeleton":
+            payload = synthesize_weekly_skeleton(messages)
+        elif template == "weekly_day":
+            payload = synthesize_weekly_day(messages)
+        elif template == "weekly_plan":
+            payload = synthesize_weekly_plan(messages)
+        else:
+            payload = synthesize_recipe(messages)
+        return json.dumps(payload, indent=2)
+
+    @app.get("/v1/models")
+    async def list_models():
+        return {"object": "list", "data": [{"id": "stub", "object": "model", "owned_by": "local"}]}
+
+    @app.get("/stats")
+    async def stub_stats():
+        return state.stats
+
+    @app.post("/v1/chat/completions")
+    async def chat_completions(request: Request):
+        body = await request.json()
+        state.stats["requests"] += 1
+        started = time.monotonic()
+
+        error_status = state.injected_error()
+        if error_status is not None:
+            state.stats["injected_errors"] += 1
+            if error_status == 0:
+                await asyncio.sleep(state.hang_seconds)
+            else:
+                await asyncio.sleep(state.latency.sample() / 4)
+                headers = {"Retry-After": "1"} if error_status == 429 else {}
+                return JSONResponse(
+                    status_code=error_status,
+                    headers=headers,
+                    content={"error": {"message": f"Injected stub error {error_status}", "type": "stub_error", "code": error_status}}
+                )
+
+        content = await completion_content(body, request.headers.get("authorization"))
+        if content is None:
+            return JSONResponse(status_code=404, content={"error": {"message": "No recording for this request", "type": "stub_error"}})
+
+        model = body.get("model", "stub")
+        completion_id = f"chatcmpl-{uuid.uuid4().hex[:24]}"
+        created = int(time.time())
+        usage = build_usage(state, body.get("messages", []), content)
+        remaining_latency = max(0.0, state.latency.sample() - (time.monotonic() - started))
+
+        if not body.get("stream"):
+            await asyncio.sleep(remaining_latency)
+            return {
+                "id": completion_id,
+                "object": "chat.completion",
+                "created": created,
+                "model": model,
+                "choices": [{"index": 0, "message": {"role": "assistant", "content": content}, "finish_reason": "stop"}],
+                "usage": usage,
+            }
+
+        state.stats["streams"] += 1
+        include_usage = bool((body.get("stream_options") or {}).get("include_usage"))
+
+        def chunk(delta: Dict[str, Any], finish_reason: Optional[str] = None, **extra: Any) -> str:
+            payload = {
+                "id": completion_id,
+                "object": "chat.completion.chunk",
+                "created": created,
+                "model": model,
+                "choices": [{"index": 0, "delta": delta, "finish_reason": finish_reason}],
+                **extra,
+            }
+            return f"data: {json.dumps(payload)}\n\n"
+
+        async def event_stream():
+            # Latency model covers time to first token; the rest is paced per token
+            await asyncio.sleep(remaining_latency)
+            yield chunk({"role": "assistant", "content": ""})
+            for piece in re.findall(r"\s*\S+", content):
+                yield chunk({"content": piece})
+                if state.token_delay:
+                    await asyncio.sleep(state.token_delay)
+            yield chunk({}, "stop")
+            if include_usage:
+                yield f"data: {json.dumps({'id': completion_id, 'object': 'chat.completion.chunk', 'created': created, 'model': model, 'choices': [], 'usage': usage})}\n\n"
+            yield "data: [DONE]\n\n"
+
+        return StreamingResponse(event_stream(), media_type="text/event-stream")
+
+    @app.on_event("shutdown")
+    async def close_upstream():
+        if upstream_client:
+            await upstream_client.aclose()
+
+    return app
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Local OpenAI-compatible stub for offline load tests")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8090)
+    parser.add_argument("--latency", default="lognormal:1.5,0.5", help="fixed:S | uniform:LO,HI | lognormal:MEDIAN,SIGMA (seconds)")
+    parser.add_argument("--token-delay", type=float, default=0.005, help="Seconds between streamed tokens")
+    parser.add_argument("--error-rate", default="", help="Injected failures, e.g. 500=0.02,429=0.01,timeout=0.005")
+    parser.add_argument("--hang-seconds", type=float, default=600.0, help="How long an injected timeout hangs")
+    parser.add_argument("--starbucks-invalid-rate", type=float, default=0.0, help="Share of drinks with a misspelled ingredient")
+    parser.add_argument("--recordings", help="JSONL file to replay from (and append to when recording)")
+    parser.add_argument("--record-upstream", help="Proxy to this OpenAI base URL and record completions")
+    parser.add_argument("--strict-replay", action="store_true", help="404 instead of synthesizing when nothing is recorded")
+    args = parser.parse_args()
+
+    state = StubState(args)
+    logger.info(f"🧪 OpenAI stub listening on http://{args.host}:{args.port}/v1 (latency {args.latency}, errors {args.error_rate or 'none'})")
+    uvicorn.run(create_app(state), host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+"""
+Local stand-in for the Walmart affiliate v2 search API, for offline cart benchmarks.
+
+Serves GET /api-proxy/service/affil/product/v2/search with item payloads from
+benchmarks/fixtures/walmart_search_items.json. Queries without a fixture get
+synthesized items in the same shape. Every request must carry well-formed
+WM_CONSUMER.ID / WM_CONSUMER.INTIMESTAMP / WM_SEC.KEY_VERSION /
+WM_SEC.AUTH_SIGNATURE headers; with --public-key the signature is verified too.
+Latency, 429s and timeouts are injected on request.
+
+Usage:
+    python walmart_stub_server.py --port 8095 --latency lognormal:0.35,0.4 --error-rate 429=0.02,timeout=0.005
+
+    # Point the backend at it (any syntactically valid key works without --public-key)
+    WALMART_API_BASE_URL=http://localhost:8095 WALMART_CONSUMER_ID=stub WALMART_PRIVATE_KEY="..." python main.py
+"""
+import argparse
+import asyncio
+import base64
+import binascii
+import json
+import logging
+import random
+import re
+import sys
+import time
+import zlib
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import uvicorn
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+
+from openai_stub_server import LatencyModel, parse_error_rates
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    handlers=[logging.StreamHandler(sys.stdout)]
+)
+logger = logging.getLogger("walmart_stub")
+
+DEFAULT_FIXTURES = Path(__file__).resolve().parent / "benchmarks" / "fixtures" / "walmart_search_items.json"
+SEARCH_PATH = "/api-proxy/service/affil/product/v2/search"
+REQUIRED_HEADERS = ["WM_CONSUMER.ID", "WM_CONSUMER.INTIMESTAMP", "WM_SEC.KEY_VERSION", "WM_SEC.AUTH_SIGNATURE"]
+# Walmart rejects timestamps that drift too far from its clock
+TIMESTAMP_TOLERANCE_SECONDS = 300
+
+
+def load_public_key(path: Optional[str]):
+    if not path:
+        return None
+    from cryptography.hazmat.primitives import serialization
+    return serialization.load_pem_public_key(Path(path).read_bytes())
+
+
+def validate_auth_headers(headers, public_key) -> Optional[str]:
+    """Return an error message when the Walmart auth headers are missing or malformed."""
+    missing = [name for name in REQUIRED_HEADERS if not headers.get(name)]
+    if missing:
+        return f"Missing headers: {', '.join(missing)}"
+
+    timestamp = headers["WM_CONSUMER.INTIMESTAMP"]
+    if not timestamp.isdigit() or len(timestamp) != 13:
+        return "WM_CONSUMER.INTIMESTAMP must be epoch milliseconds"
+    if abs(time.time() - int(timestamp) / 1000) > TIMESTAMP_TOLERANCE_SECONDS:
+        return "WM_CONSUMER.INTIMESTAMP is outside the allowed window"
+
+    try:
+        signature = base64.b64decode(headers["WM_SEC.AUTH_SIGNATURE"], validate=True)
+    except (binascii.Error, ValueError):
+        return "WM_SEC.AUTH_SIGNATURE is not valid Base64"
+    if len(signature) not in {128, 256, 384, 512}:
+        return f"WM_SEC.AUTH_SIGNATURE decodes to {len(signature)} bytes, not an RSA signature"
+
+    if public_key is not None:
+        from cryptography.exceptions import InvalidSignature
+        from cryptography.hazmat.primitives import hashes
+        from cryptography.hazmat.primitives.asymmetric import padding
+        signed = "".join(
+            headers[name].strip() + "\n"
+            for name in sorted(["WM_CONSUMER.ID", "WM_CONSUMER.INTIMESTAMP", "WM_SEC.KEY_VERSION"])
+        )
+        try:
+            public_key.verify(signature, signed.encode("utf-8"), padding.PKCS1v15(), hashes.SHA256())
+        except InvalidSignature:
+            return "WM_SEC.AUTH_SIGNATURE does not verify"
+    return None
+
+
+def synthesize_items(query: str, count: int) -> List[Dict[str, Any]]:
+    """Deterministic fixture-shaped items for queries without a recorded fixture."""
+    rng = random.Random(zlib.crc32(query.encode("utf-8")))
+    if rng.random() < 0.05:
+        return []
+    title = query.title()
+    items = []
+    for index, brand in enumerate(["Great Value", "Marketside", "Freshness Guaranteed", "Member's Mark", "Sam's Choice"][:count]):
+        item_id = 20000000 + rng.randint(0, 9_999_999)
+        price = round(rng.uniform(0.88, 12.97), 2)
+        size = rng.choice(["8 oz", "12 oz", "16 oz", "1 lb", "2 lb", "32 fl oz", "6 Count"])
+        items.append({
+            "itemId": item_id,
+            "parentItemId": item_id,
+            "name": f"{brand} {title}, {size}",
+            "msrp": round(price * rng.choice([1.0, 1.0, 1.15]), 2),
+            "salePrice": price,
+            "upc": str(rng.randint(10**11, 10**12 - 1)),
+            "categoryPath": "Food",
+            "shortDescription": f"{brand} {title}.",
+            "brandName": brand,
+            "thumbnailImage": f"https://i5.walmartimages.com/asr/{item_id}.jpeg?odnHeight=100&odnWidth=100",
+            "mediumImage": f"https://i5.walmartimages.com/asr/{item_id}.jpeg?odnHeight=180&odnWidth=180",
+            "productUrl": f"https://www.walmart.com/ip/{item_id}",
+            "customerRating": str(round(rng.uniform(3.6, 4.9), 1)),
+            "numReviews": rng.randint(5, 5000),
+            "availableOnline": index != 4,
+            "stock": "Available",
+            "marketplace": False,
+            "clearance": False,
+        })
+    return items
+
+
+class StubState:
+    def __init__(self, args: argparse.Namespace):
+        self.latency = LatencyModel(args.latency)
+        self.error_rates = parse_error_rates(args.error_rate)
+        self.hang_seconds = args.hang_seconds
+        self.public_key = load_public_key(args.public_key)
+        self.fixtures: Dict[str, List[Dict[str, Any]]] = json.loads(Path(args.fixtures).read_text())
+        self.stats: Dict[str, int] = {"requests": 0, "fixture_hits": 0, "synthesized": 0, "auth_failures": 0, "injected_errors": 0}
+        logger.info(f"🧺 Loaded fixtures for {len(self.fixtures)} queries from {args.fixtures}")
+
+    def injected_error(self) -> Optional[int]:
+        roll = random.random()
+        for status_code, rate in self.error_rates:
+            if roll < rate:
+                return status_code
+            roll -= rate
+        return None
+
+
+def create_app(state: StubState) -> FastAPI:
+    app = FastAPI(title="Walmart affiliate API stub")
+
+    @app.get("/stats")
+    async def stub_stats():
+        return state.stats
+
+    @app.get(SEARCH_PATH)
+    async def search(request: Request):
+        state.stats["requests"] += 1
+        auth_error = validate_auth_headers(request.headers, state.public_key)
+        if auth_error:
+            state.stats["auth_failures"] += 1
+            return JSONResponse(status_code=401, content={"errors": [{"code": 401, "message": auth_error}]})
+
+        error_status = state.injected_error()
+        if error_status is not None:
+            state.stats["injected_errors"] += 1
+            if error_status == 0:
+                await asyncio.sleep(state.hang_seconds)
+            else:
+                headers = {"Retry-After": str(random.choice([1, 2]))} if error_status == 429 else {}
+                return JSONResponse(status_code=error_status, headers=headers, content={"errors": [{"code": error_status, "message": "Injected stub error"}]})
+
+        # The backend sends an empty query= from the base URL plus the real one; use the last non-empty value
+        query = next((value for value in reversed(request.query_params.getlist("query")) if value.strip()), "")
+        num_items = int(request.query_params.get("numItems", "10"))
+        key = re.sub(r"\s+", " ", query.strip().lower())
+        if key in state.fixtures:
+            state.stats["fixture_hits"] += 1
+            items = state.fixtures[key][:num_items]
+        else:
+            state.stats["synthesized"] += 1
+            items = synthesize_items(key, num_items)
+
+        await asyncio.sleep(state.latency.sample())
+        return {
+            "query": query,
+            "sort": "relevance",
+            "responseGroup": "base",
+            "totalResults": len(items),
+            "start": 1,
+            "numItems": len(items),
+            "items": items,
+        }
+
+    return app
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Local Walmart affiliate search API stub")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8095)
+    parser.add_argument("--latency", default="lognormal:0.35,0.4", help="fixed:S | uniform:LO,HI | lognormal:MEDIAN,SIGMA (seconds)")
+    parser.add_argument("--error-rate", default="", help="Injected failures, e.g. 429=0.02,500=0.01,timeout=0.005")
+    parser.add_argument("--hang-seconds", type=float, default=60.0, help="How long an injected timeout hangs")
+    parser.add_argument("--fixtures", default=str(DEFAULT_FIXTURES))
+    parser.add_argument("--public-key", help="PEM public key; when set, signatures are verified, not just format-checked")
+    args = parser.parse_args()
+
+    state = StubState(args)
+    logger.info(f"🧪 Walmart stub listening on http://{args.host}:{args.port}{SEARCH_PATH} (latency {args.latency}, errors {args.error_rate or 'none'})")
+    uvicorn.run(create_app(state), host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()